@@ -11,8 +11,40 @@ Usage:
 """
 
 import json
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timezone
+from types import MappingProxyType
+
+# orjson parses JSONL records considerably faster than stdlib json; fall
+# back if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers outside the 64-bit range into floats instead of
+# failing. With digits mapped to '0', ',' and '[' to ':' and whitespace
+# dropped, every number token directly follows a ':', so two substring
+# searches find any that may not fit in 64 bits.
+_INT_SCAN_TABLE = bytes.maketrans(b'0123456789,[', b'0000000000::')
+_LONG_INT = b':' + b'0' * 20
+_LONG_NEGATIVE_INT = b':-' + b'0' * 19
+
+
+def json_loads(data):
+    """Parse one JSON document from bytes, with orjson where it matches stdlib json."""
+    if orjson is not None:
+        scan = b':' + data.translate(_INT_SCAN_TABLE, b' \t\n\r')
+        if _LONG_INT not in scan and _LONG_NEGATIVE_INT not in scan:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+# Read-only default for missing sub-dicts inside per-event loops
+_EMPTY = MappingProxyType({})
 
 
 def load_events():
@@ -38,7 +70,7 @@ def load_events():
     # Group by event type (from Header.EventType)
     by_type = {}
     for e in events:
-        header = e.get("Header", {})
+        header = e.get("Header", _EMPTY)
         t = header.get("EventType", "Unknown")
         by_type[t] = by_type.get(t, 0) + 1
     
@@ -56,36 +88,29 @@ def analyze_trading_scenarios(events):
     print("Trading Scenario Analysis")
     print("=" * 60)
     
-    # Extract unique symbols from Governance.Symbol or TradeFields
-    symbols = set()
+    # Group events by symbol (Governance.Symbol or TradeFields) in one pass
+    by_symbol = {}
     for e in events:
-        gov = e.get("Governance", {})
+        gov = e.get("Governance", _EMPTY)
         # Try different possible locations for symbol
         symbol = gov.get("Symbol")
         if not symbol:
-            trade_fields = gov.get("TradeFields", {})
+            trade_fields = gov.get("TradeFields", _EMPTY)
             symbol = trade_fields.get("Symbol")
         if symbol:
-            symbols.add(symbol)
+            by_symbol.setdefault(symbol, []).append((e, gov))
     
-    if not symbols:
+    if not by_symbol:
         print("\nNo trading symbols found (may be system events only)")
         return
     
-    print(f"\nSymbols traded: {', '.join(sorted(symbols))}")
+    print(f"\nSymbols traded: {', '.join(sorted(by_symbol))}")
     
     # Analyze each symbol's order lifecycle
-    for symbol in sorted(symbols):
+    for symbol in sorted(by_symbol):
         print(f"\n--- {symbol} ---")
-        symbol_events = []
-        for e in events:
-            gov = e.get("Governance", {})
-            s = gov.get("Symbol") or gov.get("TradeFields", {}).get("Symbol")
-            if s == symbol:
-                symbol_events.append(e)
-        
-        for e in symbol_events:
-            header = e.get("Header", {})
+        for e, gov in by_symbol[symbol]:
+            header = e.get("Header", _EMPTY)
             event_type = header.get("EventType", "?")
             ts_ns = header.get("TimestampInt", 0)
             
@@ -94,8 +119,7 @@ def analyze_trading_scenarios(events):
             dt = datetime.fromtimestamp(ts_sec, tz=timezone.utc)
             time_str = dt.strftime("%H:%M:%S.%f")
             
-            gov = e.get("Governance", {})
-            trade_fields = gov.get("TradeFields", {})
+            trade_fields = gov.get("TradeFields", _EMPTY)
             
             if event_type == "ORD":
                 print(f"  {time_str} | {event_type} | "
@@ -146,20 +170,21 @@ def show_ouch_correlation():
     print("OUCH Protocol Correlation")
     print("=" * 60)
     
-    ouch_messages = []
-    with open("ouch_messages.jsonl", "r") as f:
+    # Stream the file, keeping only counters and the first few messages
+    by_type = Counter()
+    samples = []
+    with open("ouch_messages.jsonl", "rb") as f:
         for line in f:
-            if line.strip():
-                ouch_messages.append(json.loads(line))
+            if not line.strip():
+                continue
+            msg = json_loads(line)
+            by_type[msg.get("message_type", "?")] += 1
+            if len(samples) < 3:
+                samples.append(msg)
     
-    print(f"\nTotal OUCH messages: {len(ouch_messages)}")
+    print(f"\nTotal OUCH messages: {sum(by_type.values())}")
     
     # Show message type distribution
-    by_type = {}
-    for msg in ouch_messages:
-        t = msg.get("message_type", "?")
-        by_type[t] = by_type.get(t, 0) + 1
-    
     type_names = {
         "O": "Enter Order",
         "A": "Order Accepted",
@@ -176,8 +201,8 @@ def show_ouch_correlation():
     
     # Show sample correlation
     print("\nSample Correlations:")
-    for msg in ouch_messages[:3]:
-        parsed = msg.get("parsed", {})
+    for msg in samples:
+        parsed = msg.get("parsed", _EMPTY)
         print(f"  OUCH {msg.get('message_type')} → "
               f"VCP Event: {msg.get('vcp_event_id', 'N/A')[:20]}...")
         print(f"    Order Token: {parsed.get('order_token', 'N/A')}")
@@ -190,20 +215,20 @@ def show_itch_market_data():
     print("ITCH Market Data")
     print("=" * 60)
     
-    itch_messages = []
-    with open("itch_messages.jsonl", "r") as f:
+    # Stream the file, building the locate code map as messages arrive
+    total = 0
+    locate_map = {}
+    with open("itch_messages.jsonl", "rb") as f:
         for line in f:
-            if line.strip():
-                itch_messages.append(json.loads(line))
+            if not line.strip():
+                continue
+            msg = json_loads(line)
+            total += 1
+            if msg.get("message_type") == "R":
+                parsed = msg.get("parsed", _EMPTY)
+                locate_map[parsed.get("stock_locate")] = parsed.get("stock")
     
-    print(f"\nTotal ITCH messages: {len(itch_messages)}")
-    
-    # Build locate code map
-    locate_map = {}
-    for msg in itch_messages:
-        if msg.get("message_type") == "R":
-            parsed = msg.get("parsed", {})
-            locate_map[parsed.get("stock_locate")] = parsed.get("stock")
+    print(f"\nTotal ITCH messages: {total}")
     
     print("\nStock Locate Codes:")
     for code, symbol in sorted(locate_map.items(), key=lambda x: x[1]):
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+VCP v1.1 Inclusion Proof Generator
+==================================
+
+Regenerates the inclusion-proof files derived from batches.json:
+
+    inclusion_multiproof.json         Batched proof for the InclusionProofs events
+    inclusion_proofs_compressed.json  Front-encoded InclusionProofs paths
+
+Usage:
+    python generate_proofs.py
+
+Run it whenever batches.json changes, then update hash_manifest.json.
+"""
+
+import hashlib
+import json
+import sys
+from typing import List
+
+from verify import (
+    BATCHES_FILE, COMPRESSED_PROOFS_FILE, MULTIPROOF_FILE, compress_proofs, load_json,
+)
+
+# =============================================================================
+# Builders
+# =============================================================================
+
+def build_multiproof(digests: List[bytes], indices: List[int]) -> dict:
+    """Build a batched inclusion proof for the leaves at indices.
+    
+    Instead of one audit path per leaf, only the sibling nodes that cannot
+    be derived from the proven leaves themselves are recorded, level by
+    level and left to right. Level-0 siblings go to LeafCopath as event
+    hashes; higher ones to InnerCopath as node hashes.
+    """
+    sha256 = hashlib.sha256
+    indices = sorted(set(indices))
+    
+    nodes = [sha256(b'\x00' + d).digest() for d in digests]
+    known = set(indices)
+    leaf_copath = []
+    inner_copath = []
+    
+    while len(nodes) > 1:
+        width = len(nodes)
+        for parent in sorted({pos // 2 for pos in known}):
+            for pos in (parent * 2, parent * 2 + 1):
+                if pos < width and pos not in known:
+                    if width == len(digests):
+                        leaf_copath.append(digests[pos].hex())
+                    else:
+                        inner_copath.append(nodes[pos].hex())
+        
+        known = {pos // 2 for pos in known}
+        nodes = [sha256(b'\x01' + nodes[i] + nodes[min(i + 1, width - 1)]).digest()
+                 for i in range(0, width, 2)]
+    
+    return {
+        'LeafCount': len(digests),
+        'Indices': indices,
+        'LeafCopath': leaf_copath,
+        'InnerCopath': inner_copath,
+    }
+
+def write_json(filepath, data: dict) -> None:
+    """Write data in the evidence pack's JSON layout."""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=2, ensure_ascii=False))
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    batches = load_json(BATCHES_FILE)
+    digests = [bytes.fromhex(h) for h in batches.get('EventHashes', [])]
+    inclusion_proofs = batches.get('InclusionProofs', {})
+    indices = [proof['index'] for proof in inclusion_proofs.values()]
+    if not digests or not indices:
+        print(f"❌ {BATCHES_FILE.name} has no EventHashes or InclusionProofs")
+        return 1
+    
+    multi_proof = {
+        'BatchID': batches.get('BatchID'),
+        'MerkleConstruction': batches.get('MerkleConstruction'),
+        **build_multiproof(digests, indices),
+    }
+    write_json(MULTIPROOF_FILE, multi_proof)
+    print(f"✅ Wrote {MULTIPROOF_FILE.name} ({len(multi_proof['Indices'])} events)")
+    
+    compressed = {
+        'BatchID': batches.get('BatchID'),
+        'MerkleConstruction': batches.get('MerkleConstruction'),
+        'LeafCount': len(digests),
+        'Encoding': 'FRONT_CODED_ROOT_FIRST',
+        'Proofs': [list(p) for p in compress_proofs(inclusion_proofs)],
+    }
+    write_json(COMPRESSED_PROOFS_FILE, compressed)
+    print(f"✅ Wrote {COMPRESSED_PROOFS_FILE.name} ({len(compressed['Proofs'])} events)")
+    
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
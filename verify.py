@@ -6,10 +6,11 @@ VCP v1.1 Platinum Tier Verification Script
 Verifies the cryptographic integrity of Nasdaq OUCH/ITCH evidence pack.
 
 Usage:
-    python verify.py [--verbose]
+    python verify.py [--verbose] [--fail-fast]
 
 Requirements:
-    pip install pynacl
+    pip install pynacl  (or: pip install cryptography)
+    pip install orjson  (optional, faster canonicalization)
 
 References:
     - VCP Specification v1.1
@@ -20,20 +21,61 @@ References:
 
 import json
 import hashlib
+import mmap
+import os
 import sys
 import base64
+import operator
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Errors by which the available Ed25519 backends report a bad signature
+BAD_SIGNATURE_ERRORS: tuple = ()
 
 # Try to import PyNaCl for signature verification
 try:
+    import nacl.bindings
     import nacl.signing
     import nacl.encoding
     from nacl.exceptions import BadSignatureError as BadSignature
     NACL_AVAILABLE = True
+    BAD_SIGNATURE_ERRORS += (BadSignature,)
 except ImportError:
     NACL_AVAILABLE = False
-    print("⚠️ PyNaCl not installed. Install with: pip install pynacl")
+
+# Try to import cryptography as a fallback Ed25519 backend when PyNaCl
+# is missing; libsodium verifies faster, so PyNaCl is preferred
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    CRYPTOGRAPHY_AVAILABLE = True
+    BAD_SIGNATURE_ERRORS += (InvalidSignature,)
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+# Ed25519 signature length (RFC 8032)
+ED25519_SIGNATURE_BYTES = 64
+
+if NACL_AVAILABLE:
+    ED25519_BACKEND = 'pynacl'
+elif CRYPTOGRAPHY_AVAILABLE:
+    ED25519_BACKEND = 'cryptography'
+else:
+    ED25519_BACKEND = None
+    print("⚠️ No Ed25519 backend installed. Install with: pip install pynacl (or: pip install cryptography)")
+
+# Try to import orjson for faster canonicalization
+# (stdlib json is the fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # =============================================================================
 # Configuration
@@ -44,8 +86,50 @@ EVENTS_FILE = EVIDENCE_PACK_DIR / "events.json"
 BATCHES_FILE = EVIDENCE_PACK_DIR / "batches.json"
 ANCHORS_FILE = EVIDENCE_PACK_DIR / "anchors.json"
 HASH_MANIFEST_FILE = EVIDENCE_PACK_DIR / "hash_manifest.json"
+MULTIPROOF_FILE = EVIDENCE_PACK_DIR / "inclusion_multiproof.json"
+COMPRESSED_PROOFS_FILE = EVIDENCE_PACK_DIR / "inclusion_proofs_compressed.json"
 PUBLIC_KEY_JWK = EVIDENCE_PACK_DIR / "keys" / "signer_ed25519_pub.jwk"
 PUBLIC_KEY_PEM = EVIDENCE_PACK_DIR / "keys" / "signer_ed25519_pub.pem"
+PEM_PUBLIC_KEY_RE = re.compile(r'-----BEGIN PUBLIC KEY-----(.+?)-----END PUBLIC KEY-----', re.DOTALL)
+
+# Files up to this size are hashed through a zero-copy mmap; larger ones
+# are streamed in chunks so they do not crowd out the page cache
+MMAP_MAX_BYTES = 256 * 1024 * 1024
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Packs with at least this many events are verified across all CPU cores;
+# below it, process start-up costs more than it saves
+PARALLEL_MIN_EVENTS = 5000
+
+# Stored digests must be exactly 64 lowercase hex characters to be decoded;
+# anything else is compared as-is and so never matches a computed digest
+DIGEST_HEX_RE = re.compile(r'[0-9a-f]{64}')
+
+# orjson output tokens that json.dumps may write differently: NaN and
+# Infinity come out as null, and floats that Python writes in exponent form
+# come out as 0.0000x or with a bare exponent such as 1e16 or 1e-6.
+# Value tokens are paired with the bytes that can precede a value.
+ORJSON_VALUE_TOKENS = ((b'null', b':,['), (b'0.0000', b':,[-'))
+ORJSON_EXPONENT_RE = re.compile(rb'e-?\d+[,}\]]')
+
+# orjson is only used for canonicalization if it reproduces json.dumps byte
+# for byte on this sample of key orders, string escapes and number formats
+_CANONICAL_SAMPLE = {
+    'b': [0, -1, 2**63, 2**64 - 1, 0.1, -0.0, 1e15, 123456.789, 0.0001, True, False],
+    'a': {'\u00e9': '\u2028\x00\x1f\x7f"\\/\U0001f600', 'B': '', 'Z': {}},
+    '\u00e9z': [],
+}
+ORJSON_CANONICAL = ORJSON_AVAILABLE and (
+    orjson.dumps(_CANONICAL_SAMPLE, option=orjson.OPT_SORT_KEYS)
+    == json.dumps(_CANONICAL_SAMPLE, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+)
+
+# Top-level fields left out of the event hash
+HASH_EXCLUDED_FIELDS = frozenset(('Hash', 'hash', 'Signature', 'signature'))
+
+# Shared read-only default for missing sub-dicts in hot loops, so a miss
+# does not build a fresh empty dict every time
+_EMPTY = MappingProxyType({})
 
 # =============================================================================
 # Helper Functions
@@ -56,43 +140,293 @@ def load_json(filepath: Path) -> dict:
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def canonicalize(obj: dict) -> str:
+def orjson_diverges(canonical: bytes) -> bool:
+    """Check orjson output for number tokens json.dumps may write differently.
+    
+    null and 0.0000 only count where they start a value, which plain find()
+    calls can check; strings that merely look like such a token just send
+    the object to stdlib json.
+    """
+    for token, starts in ORJSON_VALUE_TOKENS:
+        i = canonical.find(token)
+        while i > 0:
+            if canonical[i - 1] in starts:
+                return True
+            i = canonical.find(token, i + 1)
+    return ORJSON_EXPONENT_RE.search(canonical) is not None
+
+def canonicalize(obj: dict) -> bytes:
     """Simplified RFC 8785 canonicalization."""
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    if ORJSON_CANONICAL:
+        try:
+            canonical = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits or non-string keys
+        else:
+            if not orjson_diverges(canonical):
+                return canonical
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def canonicalize_event(event: dict) -> bytes:
+    """Canonical bytes of event (excluding hash and signature fields)."""
+    event_copy = {
+        k: {hk: hv for hk, hv in v.items() if hk != 'EventHash'} if k == 'Header' and isinstance(v, dict) else v
+        for k, v in event.items()
+        if k not in HASH_EXCLUDED_FIELDS
+    }
+    
+    return canonicalize(event_copy)
 
 def compute_event_hash(event: dict) -> str:
     """Compute SHA-256 hash of event (excluding hash and signature fields)."""
-    event_copy = {}
-    for k, v in event.items():
-        if k in ('Hash', 'hash', 'Signature', 'signature'):
-            continue
-        if k == 'Header' and isinstance(v, dict):
-            header_copy = {hk: hv for hk, hv in v.items() if hk != 'EventHash'}
-            event_copy[k] = header_copy
-        else:
-            event_copy[k] = v
-    
-    canonical = canonicalize(event_copy)
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return hashlib.sha256(canonicalize_event(event)).hexdigest()
+
+def sha256_many(blobs: List[bytes]) -> List[bytes]:
+    """Compute SHA-256 digests of independent messages in one call."""
+    sha256 = hashlib.sha256
+    return [sha256(blob).digest() for blob in blobs]
 
-def compute_merkle_root(hashes: List[str]) -> str:
+def hash_event_chunk(events: List[dict]) -> List[bytes]:
+    """Compute SHA-256 digests of a slice of events."""
+    return sha256_many([canonicalize_event(event) for event in events])
+
+def first_chain_failure(items: List[Tuple[dict, Optional[bytes], bool]]) -> Tuple[Optional[int], Optional[bytes]]:
+    """Find the first failing event in a slice of (event, stored digest, linked) triples.
+    
+    Returns (index within slice, computed digest), with digest None when the
+    PrevHash link is broken, or (None, None) if the whole slice verifies.
+    Events after the first failure are not hashed.
+    """
+    for i, (event, stored_digest, linked) in enumerate(items):
+        if not linked:
+            return i, None
+        digest = hashlib.sha256(canonicalize_event(event)).digest()
+        if digest != stored_digest:
+            return i, digest
+    return None, None
+
+def map_event_chunks(func, items: list, *args) -> List[Tuple[int, object]]:
+    """Apply func(chunk, *args) to slices of per-event items, returning (offset, result) pairs.
+    
+    Large packs are split into one slice per CPU core and processed in
+    worker processes; small packs run in-process as a single slice.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(items) < PARALLEL_MIN_EVENTS:
+        return [(0, func(items, *args))]
+    
+    size = -(-len(items) // workers)
+    offsets = range(0, len(items), size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(func, items[o:o + size], *args) for o in offsets]
+        return [(o, future.result()) for o, future in zip(offsets, futures)]
+
+def build_columns(events: List[dict]) -> Dict[str, list]:
+    """Extract the fields the verification passes scan into one list per field.
+    
+    Built once after loading so each pass walks flat lists instead of
+    re-indirecting through every event's nested dicts.
+    """
+    event_hashes = []
+    prev_hashes = []
+    signatures = []
+    for event in events:
+        header = event.get('Header', _EMPTY)
+        event_hashes.append(header.get('EventHash'))
+        prev_hashes.append(header.get('PrevHash'))
+        signature = event.get('Signature')
+        signatures.append(signature.get('Value') if isinstance(signature, dict) else signature)
+    
+    return {
+        'event_hash': event_hashes,
+        'prev_hash': prev_hashes,
+        'signature': signatures,
+    }
+
+def hex_to_digest(value):
+    """Decode a lowercase hex SHA-256 digest to bytes, returning any other value unchanged."""
+    if isinstance(value, str) and DIGEST_HEX_RE.fullmatch(value):
+        return bytes.fromhex(value)
+    return value
+
+def compute_merkle_root(digests: List[bytes]) -> str:
     """Compute Merkle root per RFC 6962."""
-    if not hashes:
+    if not digests:
         return hashlib.sha256(b'').hexdigest()
     
-    leaves = [hashlib.sha256(b'\x00' + bytes.fromhex(h)).digest() for h in hashes]
+    sha256 = hashlib.sha256
+    nodes = [sha256(b'\x00' + d).digest() for d in digests]
+    
+    # SHA-256 calls dominate; pairing nodes through one shared iterator
+    # keeps the rest of each level to a single comprehension
+    while len(nodes) > 1:
+        if len(nodes) % 2:
+            nodes.append(nodes[-1])  # odd node pairs with itself
+        pairs = iter(nodes)
+        nodes = [sha256(b'\x01' + left + right).digest() for left, right in zip(pairs, pairs)]
+    
+    return nodes[0].hex()
+
+def verify_batch_inclusion(event_hashes: List[bytes], batch_root: str, multi_proof: dict) -> bool:
+    """Verify a batched inclusion proof for several events in one traversal.
+    
+    event_hashes are the digests of every leaf in the batch; the proof
+    covers those at multi_proof['Indices'] and must describe a tree of
+    exactly that many leaves. Each interior node is hashed once no matter
+    how many proven leaves share it.
+    """
+    sha256 = hashlib.sha256
+    leaf_count = multi_proof.get('LeafCount')
+    indices = multi_proof.get('Indices')
+    if type(leaf_count) is not int or leaf_count < 1 or leaf_count != len(event_hashes):
+        return False
+    if not isinstance(indices, list) or not indices:
+        return False
+    
+    level = {}
+    for index in indices:
+        if type(index) is not int or not 0 <= index < leaf_count:
+            return False
+        level[index] = sha256(b'\x00' + event_hashes[index]).digest()
+    if len(level) != len(indices):
+        return False
+    
+    try:
+        leaf_copath = [sha256(b'\x00' + bytes.fromhex(h)).digest() for h in multi_proof.get('LeafCopath', [])]
+        inner_copath = [bytes.fromhex(h) for h in multi_proof.get('InnerCopath', [])]
+    except (TypeError, ValueError):
+        return False
+    
+    # Leaf siblings are only valid on level 0; the rest must be interior
+    leaf_siblings = iter(leaf_copath)
+    inner_siblings = iter(inner_copath)
+    copath = leaf_siblings
+    width = leaf_count
+    while width > 1:
+        parents = {}
+        for parent in sorted({pos // 2 for pos in level}):
+            left_pos = parent * 2
+            right_pos = left_pos + 1
+            left = level[left_pos] if left_pos in level else next(copath, None)
+            if right_pos >= width:
+                right = left
+            else:
+                right = level[right_pos] if right_pos in level else next(copath, None)
+            if left is None or right is None:
+                return False
+            parents[parent] = sha256(b'\x01' + left + right).digest()
+        
+        if copath is leaf_siblings:
+            if next(leaf_siblings, None) is not None:
+                return False
+            copath = inner_siblings
+        level = parents
+        width = (width + 1) // 2
+    
+    # Unused siblings mean the proof does not describe this tree
+    if next(leaf_siblings, None) is not None or next(inner_siblings, None) is not None:
+        return False
+    return level[0].hex() == batch_root
+
+def compress_proofs(proofs: Dict[str, dict]) -> List[Tuple[int, int, List[str]]]:
+    """Front-encode audit paths as (index, prefix_len, suffix) in leaf order.
+    
+    Paths are stored root first, so neighbouring leaves share a prefix of
+    ancestors' siblings that only needs to be written once.
+    """
+    compressed = []
+    prev_path = []
+    for proof in sorted(proofs.values(), key=lambda p: p['index']):
+        path = proof['path'][::-1]
+        prefix_len = 0
+        for a, b in zip(prev_path, path):
+            if a != b:
+                break
+            prefix_len += 1
+        compressed.append((proof['index'], prefix_len, path[prefix_len:]))
+        prev_path = path
+    return compressed
+
+def expand_proofs(compressed: List[Tuple[int, int, List[str]]]) -> List[Tuple[int, List[str]]]:
+    """Rebuild leaf-to-root audit paths from compress_proofs output."""
+    proofs = []
+    prev_path = []
+    for index, prefix_len, suffix in compressed:
+        path = prev_path[:prefix_len] + list(suffix)
+        proofs.append((index, path[::-1]))
+        prev_path = path
+    return proofs
+
+def verify_compressed_proofs(event_hashes: List[bytes], batch_root: str,
+                             compressed: List[Tuple[int, int, List[str]]],
+                             fail_fast: bool = False) -> Tuple[int, List[int]]:
+    """Verify front-encoded audit paths.
+    
+    Returns the number of paths that verified and the indices that did not.
+    
+    Every interior node is remembered per depth, with the path that proved
+    it, once that path has reached the root. A later path that meets such
+    a node is settled there if the rest of its siblings match the proving
+    path's, so shared ancestors are hashed only once. With fail_fast,
+    stops at the first failing path.
+    """
+    sha256 = hashlib.sha256
+    verified: Dict[int, Dict[int, Tuple[bytes, List[bytes]]]] = {}
+    passed = 0
+    failures = []
     
-    while len(leaves) > 1:
-        next_level = []
-        for i in range(0, len(leaves), 2):
-            if i + 1 < len(leaves):
-                node = hashlib.sha256(b'\x01' + leaves[i] + leaves[i + 1]).digest()
+    for index, path in expand_proofs(compressed):
+        try:
+            if type(index) is not int or index < 0:
+                raise IndexError(index)
+            node = sha256(b'\x00' + event_hashes[index]).digest()
+            siblings = [bytes.fromhex(h) for h in path]
+        except (IndexError, TypeError, ValueError):
+            failures.append(index)
+            if fail_fast:
+                break
+            continue
+        
+        pending = []
+        pos = index
+        ok = None
+        for depth, sibling in enumerate(siblings, start=1):
+            if pos % 2 == 0:
+                node = sha256(b'\x01' + node + sibling).digest()
             else:
-                node = hashlib.sha256(b'\x01' + leaves[i] + leaves[i]).digest()
-            next_level.append(node)
-        leaves = next_level
+                node = sha256(b'\x01' + sibling + node).digest()
+            pos //= 2
+            known = verified.get(depth, _EMPTY).get(pos)
+            if known is not None:
+                ok = known[0] == node and known[1][depth:] == siblings[depth:]
+                break
+            pending.append((depth, pos, node))
+        if ok is None:
+            ok = pos == 0 and node.hex() == batch_root
+        
+        if ok:
+            passed += 1
+            for depth, pos, digest in pending:
+                verified.setdefault(depth, {})[pos] = (digest, siblings)
+        else:
+            failures.append(index)
+            if fail_fast:
+                break
     
-    return leaves[0].hex()
+    return passed, failures
+
+def sha256_file(filepath: Path) -> str:
+    """Compute SHA-256 hex digest of a file without reading it into memory."""
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= MMAP_MAX_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        
+        h = hashlib.sha256()
+        while chunk := f.read(HASH_CHUNK_BYTES):
+            h.update(chunk)
+        return h.hexdigest()
 
 def load_public_key() -> Optional[bytes]:
     """Load Ed25519 public key from JWK or PEM."""
@@ -103,10 +437,7 @@ def load_public_key() -> Optional[bytes]:
             if jwk.get('kty') == 'OKP' and jwk.get('crv') == 'Ed25519':
                 x_value = jwk['x']
                 # Add padding for base64url
-                padding = 4 - len(x_value) % 4
-                if padding != 4:
-                    x_value += '=' * padding
-                return base64.urlsafe_b64decode(x_value)
+                return base64.urlsafe_b64decode(x_value + '=' * (-len(x_value) % 4))
         except Exception as e:
             print(f"⚠️ Failed to load JWK: {e}")
     
@@ -116,8 +447,7 @@ def load_public_key() -> Optional[bytes]:
             with open(PUBLIC_KEY_PEM, 'r') as f:
                 pem = f.read()
             # Extract base64 content
-            import re
-            match = re.search(r'-----BEGIN PUBLIC KEY-----(.+?)-----END PUBLIC KEY-----', pem, re.DOTALL)
+            match = PEM_PUBLIC_KEY_RE.search(pem)
             if match:
                 b64_content = match.group(1).replace('\n', '').replace(' ', '')
                 der = base64.b64decode(b64_content)
@@ -133,87 +463,203 @@ def load_public_key() -> Optional[bytes]:
 # Verification Functions
 # =============================================================================
 
-def verify_hash_chain(events: List[dict]) -> Tuple[int, int, List[str]]:
-    """Verify SHA-256 hash chain integrity."""
+def verify_hash_chain(events: List[dict], columns: Optional[Dict[str, list]] = None,
+                      fail_fast: bool = False) -> Tuple[int, int, List[str]]:
+    """Verify SHA-256 hash chain integrity.
+    
+    With fail_fast, each slice of events stops hashing at its first
+    mismatch and only the lowest-index failure is reported.
+    """
+    if columns is None:
+        columns = build_columns(events)
+    stored_hashes = columns['event_hash']
+    stored_prevs = columns['prev_hash']
+    
+    # Compare raw 32-byte digests; hex is only needed for error messages
+    stored_digests = list(map(hex_to_digest, stored_hashes))
+    
+    # Each event must link to the last non-empty EventHash before it
+    genesis = ('0' * 64, b'\x00' * 32)
+    expected = list(accumulate(
+        [genesis] + list(zip(stored_hashes, stored_digests))[:-1],
+        lambda prev, cur: cur if cur[0] else prev,
+    ))
+    
+    link_ok = list(map(operator.eq, map(hex_to_digest, stored_prevs), (d for _, d in expected)))
+    
+    def link_error(i: int) -> str:
+        prev_hash = expected[i][0]
+        stored_prev = stored_prevs[i]
+        return f"Event {i}: PrevHash mismatch (expected {prev_hash[:16]}..., got {stored_prev[:16] if stored_prev else 'None'}...)"
+    
+    def hash_error(i: int, digest: bytes) -> str:
+        stored_hash = stored_hashes[i]
+        return f"Event {i}: EventHash mismatch (computed {digest.hex()[:16]}..., stored {stored_hash[:16] if stored_hash else 'None'}...)"
+    
+    if fail_fast:
+        # Each slice stops hashing at its own first failure; slices come back
+        # in order, so the first one that reports a failure has the lowest index
+        items = list(zip(events, stored_digests, link_ok))
+        for offset, (i, digest) in map_event_chunks(first_chain_failure, items):
+            if i is not None:
+                i += offset
+                return i, 1, [link_error(i) if digest is None else hash_error(i, digest)]
+        return len(events), 0, []
+    
+    # Event hashes do not depend on each other (linkage uses the stored
+    # PrevHash), so canonicalize and hash everything up front in one batch
+    digests = []
+    for _, chunk_digests in map_event_chunks(hash_event_chunk, events):
+        digests.extend(chunk_digests)
+    
+    hash_ok = list(map(operator.eq, digests, stored_digests))
+    
+    passed = sum(hash_ok)
+    failed = link_ok.count(False) + hash_ok.count(False)
+    errors = []
+    
+    if failed:
+        for i, (linked, hashed) in enumerate(zip(link_ok, hash_ok)):
+            if not linked:
+                errors.append(link_error(i))
+            if not hashed:
+                errors.append(hash_error(i, digests[i]))
+    
+    return passed, failed, errors
+
+@lru_cache(maxsize=None)
+def _ed25519_public_key(public_key_bytes: bytes):
+    """Load a raw 32-byte Ed25519 public key into the active backend, once per key."""
+    if ED25519_BACKEND == 'cryptography':
+        return Ed25519PublicKey.from_public_bytes(public_key_bytes)
+    return nacl.signing.VerifyKey(public_key_bytes)
+
+def _verify_ed25519(public_key_bytes: bytes, sig_bytes: bytes, message: bytes) -> None:
+    """Verify one Ed25519 signature with the backend chosen at import time.
+    
+    Raises one of BAD_SIGNATURE_ERRORS if the signature is invalid, or
+    ValueError if it is not 64 bytes long, so both backends report a
+    malformed signature the same way.
+    """
+    if len(sig_bytes) != ED25519_SIGNATURE_BYTES:
+        raise ValueError(f"The signature must be exactly {ED25519_SIGNATURE_BYTES} bytes long")
+    if ED25519_BACKEND == 'cryptography':
+        _ed25519_public_key(public_key_bytes).verify(sig_bytes, message)
+    else:
+        nacl.bindings.crypto_sign_open(sig_bytes + message, public_key_bytes)
+
+def ed25519_verify_each(public_key_bytes: bytes, items: List[Tuple[bytes, bytes]]) -> Iterator[Optional[Exception]]:
+    """Verify (message, signature) pairs under one Ed25519 key.
+    
+    Yields None for each valid pair, otherwise the verification error.
+    Neither backend has a batch-verification entry point, so each pair
+    goes through _verify_ed25519 in turn.
+    """
+    verify = _verify_ed25519
+    for message, sig_bytes in items:
+        try:
+            verify(public_key_bytes, sig_bytes, message)
+        except Exception as e:
+            yield e
+        else:
+            yield None
+
+def verify_signature_chunk(items: List[Tuple[Optional[str], Optional[str]]], public_key_bytes: bytes,
+                           fail_fast: bool = False) -> Tuple[int, int, List[Tuple[int, str]]]:
+    """Verify Ed25519 signatures of a slice of (signature, EventHash) pairs.
+    
+    Errors are returned as (index within slice, message) pairs. With
+    fail_fast, only the first failure in the slice is reported.
+    """
     passed = 0
     failed = 0
     errors = []
     
-    prev_hash = '0' * 64  # Genesis
-    
-    for i, event in enumerate(events):
-        header = event.get('Header', {})
-        stored_hash = header.get('EventHash')
-        stored_prev = header.get('PrevHash')
+    # Decode every (message, signature) pair first, then verify them in turn
+    indices = []
+    pairs = []
+    for i, (sig_value, event_hash) in enumerate(items):
+        if not sig_value:
+            continue
         
-        # Verify prev hash chain
-        if stored_prev != prev_hash:
-            errors.append(f"Event {i}: PrevHash mismatch (expected {prev_hash[:16]}..., got {stored_prev[:16] if stored_prev else 'None'}...)")
+        try:
+            sig_bytes = base64.b64decode(sig_value)
+            if not event_hash:
+                continue
+            
+            message = bytes.fromhex(event_hash)
+        except Exception as e:
+            errors.append((i, f"Signature error: {e}"))
             failed += 1
+            if fail_fast:
+                break  # only pairs before this one still need checking
+            continue
         
-        # Verify event hash
-        computed = compute_event_hash(event)
-        if computed != stored_hash:
-            errors.append(f"Event {i}: EventHash mismatch (computed {computed[:16]}..., stored {stored_hash[:16] if stored_hash else 'None'}...)")
-            failed += 1
-        else:
+        indices.append(i)
+        pairs.append((message, sig_bytes))
+    
+    for i, error in zip(indices, ed25519_verify_each(public_key_bytes, pairs)):
+        if error is None:
             passed += 1
+            continue
         
-        prev_hash = stored_hash if stored_hash else prev_hash
+        if isinstance(error, BAD_SIGNATURE_ERRORS):
+            message = (i, "Invalid signature")
+        else:
+            message = (i, f"Signature error: {error}")
+        if fail_fast:
+            return passed, 1, [message]
+        errors.append(message)
+        failed += 1
     
+    errors.sort(key=lambda e: e[0])
     return passed, failed, errors
 
-def verify_signatures(events: List[dict], public_key_bytes: bytes) -> Tuple[int, int, List[str]]:
+def verify_signatures(events: List[dict], public_key_bytes: bytes,
+                      columns: Optional[Dict[str, list]] = None,
+                      fail_fast: bool = False) -> Tuple[int, int, List[str]]:
     """Verify Ed25519 signatures."""
-    if not NACL_AVAILABLE:
-        return 0, 0, ["PyNaCl not available"]
+    if ED25519_BACKEND is None:
+        return 0, 0, ["No Ed25519 backend available"]
     
     passed = 0
     failed = 0
     errors = []
     
     try:
-        verify_key = nacl.signing.VerifyKey(public_key_bytes)
+        _ed25519_public_key(public_key_bytes)
     except Exception as e:
         return 0, 0, [f"Failed to create verify key: {e}"]
     
-    for i, event in enumerate(events):
-        signature = event.get('Signature', {})
-        sig_value = signature.get('Value') if isinstance(signature, dict) else signature
-        
-        if not sig_value:
-            continue
-        
-        try:
-            sig_bytes = base64.b64decode(sig_value)
-            event_hash = event.get('Header', {}).get('EventHash')
-            if not event_hash:
-                continue
-            
-            message = bytes.fromhex(event_hash)
-            verify_key.verify(message, sig_bytes)
-            passed += 1
-        except BadSignature:
-            errors.append(f"Event {i}: Invalid signature")
-            failed += 1
-        except Exception as e:
-            errors.append(f"Event {i}: Signature error: {e}")
-            failed += 1
+    if columns is None:
+        columns = build_columns(events)
+    items = list(zip(columns['signature'], columns['event_hash']))
+    
+    for offset, (p, f, chunk_errors) in map_event_chunks(verify_signature_chunk, items, public_key_bytes, fail_fast):
+        passed += p
+        failed += f
+        errors.extend(f"Event {offset + i}: {msg}" for i, msg in chunk_errors)
+        if fail_fast and f:
+            break
     
     return passed, failed, errors
 
-def verify_merkle_tree(events: List[dict], batches: dict) -> Tuple[int, int, List[str]]:
+def verify_merkle_tree(events: List[dict], batches: dict, multi_proof: Optional[dict] = None,
+                       compressed_proofs: Optional[dict] = None,
+                       columns: Optional[Dict[str, list]] = None,
+                       fail_fast: bool = False) -> Tuple[int, int, List[str]]:
     """Verify Merkle tree construction."""
     passed = 0
     failed = 0
     errors = []
     
     # Get event hashes
-    event_hashes = [e.get('Header', {}).get('EventHash') for e in events]
-    event_hashes = [h for h in event_hashes if h]
+    if columns is None:
+        columns = build_columns(events)
+    event_hashes = [h for h in columns['event_hash'] if h]
     
     # Compute Merkle root
-    computed_root = compute_merkle_root(event_hashes)
+    computed_root = compute_merkle_root([bytes.fromhex(h) for h in event_hashes])
     stored_root = batches.get('MerkleRoot')
     
     if computed_root == stored_root:
@@ -221,6 +667,8 @@ def verify_merkle_tree(events: List[dict], batches: dict) -> Tuple[int, int, Lis
     else:
         errors.append(f"MerkleRoot mismatch (computed {computed_root[:16]}..., stored {stored_root[:16] if stored_root else 'None'}...)")
         failed += 1
+        if fail_fast:
+            return passed, failed, errors
     
     # Verify stored event hashes match
     stored_hashes = batches.get('EventHashes', [])
@@ -229,10 +677,66 @@ def verify_merkle_tree(events: List[dict], batches: dict) -> Tuple[int, int, Lis
     else:
         errors.append(f"EventHashes array mismatch")
         failed += 1
+        if fail_fast:
+            return passed, failed, errors
+    
+    # Verify the batched inclusion proof against the batch it claims to
+    # cover: leaves and root come from batches.json, not from the events
+    if multi_proof:
+        try:
+            included = (
+                multi_proof.get('BatchID') == batches.get('BatchID')
+                and verify_batch_inclusion([bytes.fromhex(h) for h in stored_hashes], stored_root, multi_proof)
+            )
+        except (TypeError, ValueError):
+            included = False
+        if included:
+            passed += 1
+        else:
+            errors.append("Inclusion multiproof does not verify against batches.json")
+            failed += 1
+            if fail_fast:
+                return passed, failed, errors
+    
+    # Verify the per-event inclusion proofs of batches.json. They are checked
+    # front-encoded so ancestors shared between paths are hashed only once;
+    # a compressed proofs file, when present, must encode exactly these proofs.
+    proofs = compressed_proofs.get('Proofs', []) if compressed_proofs else None
+    inclusion_proofs = batches.get('InclusionProofs')
+    if inclusion_proofs:
+        try:
+            encoded = [list(p) for p in compress_proofs(inclusion_proofs)]
+        except (AttributeError, KeyError, TypeError):
+            encoded = None
+        if encoded is None:
+            errors.append("InclusionProofs are malformed")
+            failed += 1
+            if fail_fast:
+                return passed, failed, errors
+        elif proofs is None:
+            proofs = encoded
+        elif proofs == encoded:
+            passed += 1
+        else:
+            errors.append("Compressed inclusion proofs do not match batches.json InclusionProofs")
+            failed += 1
+            if fail_fast:
+                return passed, failed, errors
+    
+    if proofs:
+        try:
+            digests = [bytes.fromhex(h) for h in stored_hashes]
+            proofs_passed, failures = verify_compressed_proofs(digests, stored_root, proofs, fail_fast)
+            passed += proofs_passed
+            failed += len(failures)
+            errors.extend(f"Inclusion proof failed for event index {i}" for i in failures)
+        except (TypeError, ValueError):
+            errors.append("Inclusion proofs are malformed")
+            failed += 1
     
     return passed, failed, errors
 
-def verify_file_integrity(manifest: dict) -> Tuple[int, int, List[str]]:
+def verify_file_integrity(manifest: dict, fail_fast: bool = False) -> Tuple[int, int, List[str]]:
     """Verify file integrity using hash manifest."""
     passed = 0
     failed = 0
@@ -247,20 +751,23 @@ def verify_file_integrity(manifest: dict) -> Tuple[int, int, List[str]]:
         if not full_path.exists():
             errors.append(f"{filepath}: File not found")
             failed += 1
+            if fail_fast:
+                break
             continue
         
-        with open(full_path, 'rb') as f:
-            actual_hash = hashlib.sha256(f.read()).hexdigest()
+        actual_hash = sha256_file(full_path)
         
         if actual_hash == expected_hash:
             passed += 1
         else:
             errors.append(f"{filepath}: Hash mismatch")
             failed += 1
+            if fail_fast:
+                break
     
     return passed, failed, errors
 
-def verify_platinum_requirements(events: List[dict]) -> Tuple[int, int, List[str]]:
+def verify_platinum_requirements(events: List[dict], fail_fast: bool = False) -> Tuple[int, int, List[str]]:
     """Verify Platinum Tier requirements."""
     passed = 0
     failed = 0
@@ -270,7 +777,7 @@ def verify_platinum_requirements(events: List[dict]) -> Tuple[int, int, List[str
         return 0, 1, ["No events found"]
     
     # Check first event for Platinum values
-    header = events[0].get('Header', {})
+    header = events[0].get('Header', _EMPTY)
     
     # ClockSyncStatus
     clock_sync = header.get('ClockSyncStatus')
@@ -279,6 +786,8 @@ def verify_platinum_requirements(events: List[dict]) -> Tuple[int, int, List[str
     else:
         errors.append(f"ClockSyncStatus: expected PTP_LOCKED, got {clock_sync}")
         failed += 1
+        if fail_fast:
+            return passed, failed, errors
     
     # TimestampPrecision
     ts_precision = header.get('TimestampPrecision')
@@ -296,6 +805,7 @@ def verify_platinum_requirements(events: List[dict]) -> Tuple[int, int, List[str
 
 def main():
     verbose = '--verbose' in sys.argv or '-v' in sys.argv
+    fail_fast = '--fail-fast' in sys.argv
     
     print("=" * 70)
     print("VCP v1.1 Platinum Tier Verification - Nasdaq OUCH/ITCH")
@@ -315,6 +825,9 @@ def main():
         print(f"   ❌ Failed to load events: {e}")
         return 1
     
+    # Flatten the fields every pass needs once, up front
+    columns = build_columns(events)
+    
     try:
         batches = load_json(BATCHES_FILE)
         print(f"   Loaded batches.json")
@@ -322,6 +835,28 @@ def main():
         print(f"   ❌ Failed to load batches: {e}")
         batches = {}
     
+    multi_proof = None
+    if MULTIPROOF_FILE.exists():
+        try:
+            multi_proof = load_json(MULTIPROOF_FILE)
+            if not isinstance(multi_proof, dict):
+                raise ValueError("not a JSON object")
+            print(f"   Loaded {MULTIPROOF_FILE.name}")
+        except Exception as e:
+            multi_proof = None
+            print(f"   ⚠️ Failed to load multiproof: {e}")
+    
+    compressed_proofs = None
+    if COMPRESSED_PROOFS_FILE.exists():
+        try:
+            compressed_proofs = load_json(COMPRESSED_PROOFS_FILE)
+            if not isinstance(compressed_proofs, dict):
+                raise ValueError("not a JSON object")
+            print(f"   Loaded {COMPRESSED_PROOFS_FILE.name}")
+        except Exception as e:
+            compressed_proofs = None
+            print(f"   ⚠️ Failed to load compressed proofs: {e}")
+    
     try:
         manifest = load_json(HASH_MANIFEST_FILE)
         print(f"   Loaded hash_manifest.json")
@@ -338,7 +873,7 @@ def main():
     
     # 1. Hash Chain
     print("\n🔗 Verifying Hash Chain...")
-    p, f, e = verify_hash_chain(events)
+    p, f, e = verify_hash_chain(events, columns, fail_fast)
     total_passed += p
     total_failed += f
     all_errors.extend(e)
@@ -346,27 +881,34 @@ def main():
     
     # 2. Signatures
     print("\n✍️ Verifying Ed25519 Signatures...")
-    if public_key and NACL_AVAILABLE:
-        p, f, e = verify_signatures(events, public_key)
+    if fail_fast and total_failed:
+        print(f"   ⏭️ Skipped (--fail-fast)")
+    elif public_key and ED25519_BACKEND:
+        p, f, e = verify_signatures(events, public_key, columns, fail_fast)
         total_passed += p
         total_failed += f
         all_errors.extend(e)
         print(f"   {'✅' if f == 0 else '❌'} {p} signatures verified")
     else:
-        print(f"   ⚠️ Skipped (no key or PyNaCl)")
+        print(f"   ⚠️ Skipped (no key or Ed25519 backend)")
     
     # 3. Merkle Tree
     print("\n🌳 Verifying Merkle Tree...")
-    p, f, e = verify_merkle_tree(events, batches)
-    total_passed += p
-    total_failed += f
-    all_errors.extend(e)
-    print(f"   {'✅' if f == 0 else '❌'} {p} passed, {f} failed")
+    if fail_fast and total_failed:
+        print(f"   ⏭️ Skipped (--fail-fast)")
+    else:
+        p, f, e = verify_merkle_tree(events, batches, multi_proof, compressed_proofs, columns, fail_fast)
+        total_passed += p
+        total_failed += f
+        all_errors.extend(e)
+        print(f"   {'✅' if f == 0 else '❌'} {p} passed, {f} failed")
     
     # 4. File Integrity
     print("\n📁 Verifying File Integrity...")
-    if manifest:
-        p, f, e = verify_file_integrity(manifest)
+    if fail_fast and total_failed:
+        print(f"   ⏭️ Skipped (--fail-fast)")
+    elif manifest:
+        p, f, e = verify_file_integrity(manifest, fail_fast)
         total_passed += p
         total_failed += f
         all_errors.extend(e)
@@ -376,11 +918,14 @@ def main():
     
     # 5. Platinum Requirements
     print("\n🏆 Verifying Platinum Tier Requirements...")
-    p, f, e = verify_platinum_requirements(events)
-    total_passed += p
-    total_failed += f
-    all_errors.extend(e)
-    print(f"   {'✅' if f == 0 else '❌'} {p} requirements met")
+    if fail_fast and total_failed:
+        print(f"   ⏭️ Skipped (--fail-fast)")
+    else:
+        p, f, e = verify_platinum_requirements(events, fail_fast)
+        total_passed += p
+        total_failed += f
+        all_errors.extend(e)
+        print(f"   {'✅' if f == 0 else '❌'} {p} requirements met")
     
     # Summary
     print("\n" + "=" * 70)